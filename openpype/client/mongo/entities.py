@@ -892,13 +892,21 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
                 fields_s.remove(field)
         limit_query = len(fields_s) == 0
 
-    group_item = {
-        "_id": "$parent",
-        "_version_id": {"$last": "$_id"}
-    }
-    # Add name if name is needed (only for limit query)
-    if name_needed:
-        group_item["name"] = {"$last": "$name"}
+    if limit_query:
+        group_item = {
+            "_id": "$parent",
+            "_version_id": {"$last": "$_id"}
+        }
+        # Add name if name is needed (only for limit query)
+        if name_needed:
+            group_item["name"] = {"$last": "$name"}
+    else:
+        # Keep the whole last version document so a second query is not
+        #   needed to fetch the version documents.
+        group_item = {
+            "_id": "$parent",
+            "_version_doc": {"$last": "$$ROOT"}
+        }
 
     aggregate_filter = {
         "type": "version",
@@ -921,6 +929,14 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
         {"$group": group_item}
     ]
 
+    if not limit_query:
+        aggregation_pipeline.append(
+            {"$replaceRoot": {"newRoot": "$_version_doc"}}
+        )
+        projection = _prepare_fields(fields, ["parent"])
+        if projection:
+            aggregation_pipeline.append({"$project": projection})
+
     conn = get_project_connection(project_name)
     aggregate_result = conn.aggregate(aggregation_pipeline)
     if limit_query:
@@ -933,20 +949,9 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
             output[subset_id] = item_data
         return output
 
-    version_ids = [
-        doc["_version_id"]
-        for doc in aggregate_result
-    ]
-
-    fields = _prepare_fields(fields, ["parent"])
-
-    version_docs = get_versions(
-        project_name, version_ids=version_ids, fields=fields
-    )
-
     return {
         version_doc["parent"]: version_doc
-        for version_doc in version_docs
+        for version_doc in aggregate_result
     }
 
 
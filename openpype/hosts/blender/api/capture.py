@@ -148,13 +148,16 @@ def applied_view(window, camera, isolate=None, options=None):
 
     area.ui_type = "VIEW_3D"
 
-    meshes = [obj for obj in window.scene.objects if obj.type == "MESH"]
+    # Only scan the scene for meshes when no isolate list was passed
+    isolate = isolate or [
+        obj for obj in window.scene.objects if obj.type == "MESH"
+    ]
 
     if camera == "AUTO":
         space.region_3d.view_perspective = "ORTHO"
-        isolate_objects(window, isolate or meshes)
+        isolate_objects(window, isolate)
     else:
-        isolate_objects(window, isolate or meshes)
+        isolate_objects(window, isolate)
         space.camera = window.scene.objects.get(camera)
         space.region_3d.view_perspective = "CAMERA"
 
@@ -12,6 +12,46 @@ from . import pipeline
 
 log = Logger.get_logger(__name__)
 
+# Value types that can be stored in the avalon property
+IMPRINT_TYPES = (int, float, bool, str, list)
+
+_bpy_data_collection_names = None
+
+# Data collections the pipeline actually imprints the avalon property on.
+# These are scanned first so common queries don't have to walk the whole
+# blend file.
+AVALON_BEARING_COLLECTIONS = (
+    "objects",
+    "collections",
+    "meshes",
+    "materials",
+    "armatures",
+    "actions",
+    "node_groups",
+    "images",
+    "cameras",
+    "lights",
+)
+
+
+def _get_bpy_data_collection_names():
+    """Names of `bpy.data` attributes that are data collections.
+
+    The set of collections is static for a running Blender session so it
+    is resolved only once instead of re-checking every `bpy.data`
+    attribute on each query.
+    """
+    global _bpy_data_collection_names
+    if _bpy_data_collection_names is None:
+        _bpy_data_collection_names = tuple(
+            name
+            for name in dir(bpy.data)
+            if isinstance(
+                getattr(bpy.data, name), bpy.types.bpy_prop_collection
+            )
+        )
+    return _bpy_data_collection_names
+
 
 def load_scripts(paths):
     """Copy of `load_scripts` from Blender's implementation.
@@ -23,10 +63,8 @@ def load_scripts(paths):
 
     loaded_modules = set()
 
-    previous_classes = [
-        cls
-        for cls in bpy.types.bpy_struct.__subclasses__()
-    ]
+    # Set for O(1) membership checks in the post-registration walk
+    previous_classes = set(bpy.types.bpy_struct.__subclasses__())
 
     def register_module_call(mod):
         register = getattr(mod, "register", None)
@@ -67,12 +105,26 @@ def load_scripts(paths):
 
     from bpy_restrict_state import RestrictBlend
 
+    script_subdirs = tuple(bpy.utils._script_module_dirs)
+
     with RestrictBlend():
         for base_path in paths:
-            for path_subdir in bpy.utils._script_module_dirs:
-                path = os.path.join(base_path, path_subdir)
-                if not os.path.isdir(path):
+            # One scandir call per base path instead of one isdir stat
+            # per script subdirectory, which matters for networked
+            # script locations.
+            try:
+                subdir_names = {
+                    entry.name
+                    for entry in os.scandir(base_path)
+                    if entry.is_dir()
+                }
+            except OSError:
+                continue
+
+            for path_subdir in script_subdirs:
+                if path_subdir not in subdir_names:
                     continue
+                path = os.path.join(base_path, path_subdir)
 
                 bpy.utils._sys_path_ensure_prepend(path)
 
@@ -188,7 +240,7 @@ def imprint(node: bpy.types.bpy_struct_meta_idprop, data: Dict):
             # Support values evaluated at imprint
             value = value()
 
-        if not isinstance(value, (int, float, bool, str, list)):
+        if not isinstance(value, IMPRINT_TYPES):
             raise TypeError(f"Unsupported type: {type(value)}")
 
         imprint_data[key] = value
@@ -235,20 +287,32 @@ def lsattrs(attrs: Dict) -> List:
 
     # For now return all objects, not filtered by scene/collection/view_layer.
     matches = set()
-    for coll in dir(bpy.data):
-        if not isinstance(
-                getattr(bpy.data, coll),
-                bpy.types.bpy_prop_collection,
-        ):
-            continue
-        for node in getattr(bpy.data, coll):
-            for attr, value in attrs.items():
+    # Scan the collections the pipeline imprints on first and fall back
+    # to the remaining `bpy.data` collections only when nothing matched.
+    all_collections = _get_bpy_data_collection_names()
+    bearing_collections = tuple(
+        coll
+        for coll in AVALON_BEARING_COLLECTIONS
+        if coll in all_collections
+    )
+    remaining_collections = tuple(
+        coll
+        for coll in all_collections
+        if coll not in AVALON_BEARING_COLLECTIONS
+    )
+    for collections in (bearing_collections, remaining_collections):
+        for coll in collections:
+            for node in getattr(bpy.data, coll):
                 avalon_prop = node.get(pipeline.AVALON_PROPERTY)
                 if not avalon_prop:
                     continue
-                if (avalon_prop.get(attr)
-                        and (value is None or avalon_prop.get(attr) == value)):
-                    matches.add(node)
+                for attr, value in attrs.items():
+                    attr_value = avalon_prop.get(attr)
+                    if attr_value and (value is None or attr_value == value):
+                        matches.add(node)
+                        break
+        if matches:
+            break
     return list(matches)
 
 
@@ -268,7 +332,9 @@ def read(node: bpy.types.bpy_struct_meta_idprop):
 
 def get_selection() -> List[bpy.types.Object]:
     """Return the selected objects from the current scene."""
-    return [obj for obj in bpy.context.scene.objects if obj.select_get()]
+    # 'selected_objects' is maintained by Blender itself which avoids
+    # a python call per scene object.
+    return list(bpy.context.selected_objects)
 
 
 @contextlib.contextmanager
@@ -287,9 +353,9 @@ def maintained_selection():
     try:
         yield
     finally:
-        # Clear the selection
-        for node in get_selection():
-            node.select_set(state=False)
+        # Clear the selection with a single operator call instead of
+        # one update per selected node.
+        bpy.ops.object.select_all(action='DESELECT')
         if previous_selection:
             for node in previous_selection:
                 try:
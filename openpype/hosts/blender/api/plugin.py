@@ -21,6 +21,11 @@ from .lib import (
 
 VALID_EXTENSIONS = [".blend", ".json", ".abc", ".fbx"]
 
+# Bound once so node-type dispatch in loops doesn't resolve the
+# 'bpy.types' attribute chain per visited node.
+_BPY_COLLECTION_TYPE = bpy.types.Collection
+_BPY_OBJECT_TYPE = bpy.types.Object
+
 
 def asset_name(
     asset: str, subset: str, namespace: Optional[str] = None
@@ -42,7 +47,7 @@ def get_unique_number(
         return "01"
     asset_groups = avalon_container.all_objects
 
-    container_names = [c.name for c in asset_groups if c.type == 'EMPTY']
+    container_names = {c.name for c in asset_groups if c.type == 'EMPTY'}
     count = 1
     name = f"{asset}_{count:0>2}_{subset}"
     while name in container_names:
@@ -96,7 +101,9 @@ def get_parent_collection(collection):
     check_list = [bpy.context.scene.collection]
 
     for c in check_list:
-        if collection.name in c.children.keys():
+        # Name lookup in a bpy_prop_collection is a hash lookup while
+        # 'keys()' would materialize a list and scan it linearly.
+        if collection.name in c.children:
             return c
         check_list.extend(c.children)
 
@@ -171,7 +178,7 @@ class AssetLoader(LoaderPlugin):
     def _get_instance_empty(instance_name: str, nodes: List) -> Optional[bpy.types.Object]:
         """Get the 'instance empty' that holds the collection instance."""
         for node in nodes:
-            if not isinstance(node, bpy.types.Object):
+            if type(node) is not _BPY_OBJECT_TYPE:
                 continue
             if (node.type == 'EMPTY' and node.instance_type == 'COLLECTION'
                     and node.instance_collection and node.name == instance_name):
@@ -182,7 +189,7 @@ class AssetLoader(LoaderPlugin):
     def _get_instance_collection(instance_name: str, nodes: List) -> Optional[bpy.types.Collection]:
         """Get the 'instance collection' (container) for this asset."""
         for node in nodes:
-            if not isinstance(node, bpy.types.Collection):
+            if type(node) is not _BPY_COLLECTION_TYPE:
                 continue
             if node.name == instance_name:
                 return node
@@ -12,11 +12,20 @@ class AddPythonScriptToLaunchArgs(PreLaunchHook):
     launch_types = {LaunchTypes.local}
 
     def execute(self):
-        if not self.launch_context.data.get("python_scripts"):
+        python_scripts = self.launch_context.data.get("python_scripts")
+        if not python_scripts:
             return
 
+        launch_args = self.launch_context.launch_args
+        # Locate the arguments separator once and keep the index updated
+        # on insertions instead of rescanning the arguments per script.
+        try:
+            separator_index = launch_args.index("--")
+        except ValueError:
+            separator_index = None
+
         # Add path to workfile to arguments
-        for python_script_path in self.launch_context.data["python_scripts"]:
+        for python_script_path in python_scripts:
             self.log.info(
                 f"Adding python script {python_script_path} to launch"
             )
@@ -29,26 +38,26 @@ class AddPythonScriptToLaunchArgs(PreLaunchHook):
                 )
                 continue
 
-            if "--" in self.launch_context.launch_args:
+            if separator_index is not None:
                 # Insert before separator
-                separator_index = self.launch_context.launch_args.index("--")
-                self.launch_context.launch_args.insert(
+                launch_args.insert(
                     separator_index,
                     "-P",
                 )
-                self.launch_context.launch_args.insert(
+                launch_args.insert(
                     separator_index + 1,
                     python_script_path.as_posix(),
                 )
+                separator_index += 2
             else:
-                self.launch_context.launch_args.extend(
+                launch_args.extend(
                     ["-P", python_script_path.as_posix()]
                 )
 
         # Ensure separator
-        if "--" not in self.launch_context.launch_args:
-            self.launch_context.launch_args.append("--")
+        if separator_index is None:
+            launch_args.append("--")
 
-        self.launch_context.launch_args.extend(
+        launch_args.extend(
             [*self.launch_context.data.get("script_args", [])]
         )
@@ -16,12 +16,16 @@ class CollectReview(pyblish.api.InstancePlugin):
 
         self.log.debug(f"instance: {instance}")
 
-        # get cameras
-        cameras = [
-            obj
-            for obj in instance
-            if isinstance(obj, bpy.types.Object) and obj.type == "CAMERA"
-        ]
+        # get cameras and isolate objects (mesh members) in one pass
+        cameras = []
+        isolate_objects = []
+        for obj in instance:
+            if not isinstance(obj, bpy.types.Object):
+                continue
+            if obj.type == "CAMERA":
+                cameras.append(obj)
+            elif obj.type == "MESH":
+                isolate_objects.append(obj)
 
         assert len(cameras) == 1, (
             f"Not a single camera found in extraction: {cameras}"
@@ -31,13 +35,6 @@ class CollectReview(pyblish.api.InstancePlugin):
 
         focal_length = cameras[0].data.lens
 
-        # get isolate objects list from meshes instance members .
-        isolate_objects = [
-            obj
-            for obj in instance
-            if isinstance(obj, bpy.types.Object) and obj.type == "MESH"
-        ]
-
         if not instance.data.get("remove"):
 
             task = instance.context.data["task"]
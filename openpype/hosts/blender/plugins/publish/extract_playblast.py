@@ -28,18 +28,22 @@ class ExtractPlayblast(publish.Extractor):
 
         self.log.info(instance.data)
 
+        # Resolve the context scene once instead of going through the
+        # context property getter per attribute chain.
+        scene = bpy.context.scene
+
         # get scene fps
         fps = instance.data.get("fps")
         if fps is None:
-            fps = bpy.context.scene.render.fps
+            fps = scene.render.fps
             instance.data["fps"] = fps
 
         self.log.info(f"fps: {fps}")
 
         # If start and end frames cannot be determined,
         # get them from Blender timeline.
-        start = instance.data.get("frameStart", bpy.context.scene.frame_start)
-        end = instance.data.get("frameEnd", bpy.context.scene.frame_end)
+        start = instance.data.get("frameStart", scene.frame_start)
+        end = instance.data.get("frameEnd", scene.frame_end)
 
         self.log.info(f"start: {start}, end: {end}")
         assert end > start, "Invalid time range !"
@@ -59,7 +63,9 @@ class ExtractPlayblast(publish.Extractor):
 
         project_settings = instance.context.data["project_settings"]["blender"]
         presets = project_settings["publish"]["ExtractPlayblast"]["presets"]
-        preset = presets.get("default")
+        # Work on a copy so the settings preset shared through the
+        # context is not mutated with per-instance values.
+        preset = dict(presets.get("default") or {})
         preset.update({
             "camera": camera,
             "start_frame": start,
@@ -1,5 +1,4 @@
 import os
-import glob
 
 import pyblish.api
 from openpype.pipeline import publish
@@ -37,7 +36,9 @@ class ExtractThumbnail(publish.Extractor):
         family = instance.data.get("family")
         isolate = instance.data("isolate", None)
 
-        preset = self.presets.get(family, {})
+        # Work on a copy so the class-level preset is not mutated with
+        # per-instance values.
+        preset = dict(self.presets.get(family) or {})
 
         preset.update({
             "camera": camera,
@@ -77,8 +78,9 @@ class ExtractThumbnail(publish.Extractor):
     def _fix_output_path(self, filepath):
         """"Workaround to return correct filepath.
 
-        To workaround this we just glob.glob() for any file extensions and
-        assume the latest modified file is the correct file and return it.
+        To workaround this we scan the staging directory for matching
+        frame files and assume the latest modified file is the correct
+        file and return it.
 
         """
         # Catch cancelled playblast
@@ -90,10 +92,25 @@ class ExtractThumbnail(publish.Extractor):
             return None
 
         if not os.path.exists(filepath):
-            files = glob.glob(f"{filepath}.*.jpg")
+            # Single directory scan with a prefix match instead of glob,
+            # stat only when more than one file is candidate.
+            dirname, basename = os.path.split(filepath)
+            prefix = f"{basename}."
+            with os.scandir(dirname) as entries:
+                files = [
+                    entry
+                    for entry in entries
+                    if entry.name.startswith(prefix)
+                    and entry.name.endswith(".jpg")
+                ]
 
             if not files:
                 raise RuntimeError(f"Couldn't find playblast from: {filepath}")
-            filepath = max(files, key=os.path.getmtime)
+            if len(files) == 1:
+                filepath = files[0].path
+            else:
+                filepath = max(
+                    files, key=lambda entry: entry.stat().st_mtime
+                ).path
 
         return filepath
@@ -17,14 +17,15 @@ class RepairActionBase(pyblish.api.Action):
     def repair_knob(self, instances, state):
         for instance in instances:
             node = instance.data["transientData"]["node"]
-            files_remove = [os.path.join(instance.data["outputDir"], f)
-                            for r in instance.data.get("representations", [])
-                            for f in r.get("files", [])
-                            ]
-            self.log.info("Files to be removed: {}".format(files_remove))
-            for f in files_remove:
-                os.remove(f)
-                self.log.debug("removing file: {}".format(f))
+            output_dir = instance.data["outputDir"]
+            for repre in instance.data.get("representations", []):
+                for file_name in repre.get("files", []):
+                    filepath = os.path.join(output_dir, file_name)
+                    try:
+                        os.unlink(filepath)
+                    except FileNotFoundError:
+                        continue
+                    self.log.debug("removing file: {}".format(filepath))
             node["render"].setValue(state)
             self.log.info("Rendering toggled to `{}`".format(state))
 
@@ -100,9 +101,15 @@ class ValidateRenderedFrames(pyblish.api.InstancePlugin):
                     raise PublishXmlValidationError(
                         self, msg, formatting_data=f_data)
 
+            # Resolve frame extremes in a single pass over the indexes
             collected_frames_len = len(collection.indexes)
-            coll_start = min(collection.indexes)
-            coll_end = max(collection.indexes)
+            indexes_iter = iter(collection.indexes)
+            coll_start = coll_end = next(indexes_iter)
+            for index in indexes_iter:
+                if index < coll_start:
+                    coll_start = index
+                elif index > coll_end:
+                    coll_end = index
 
             self.log.info("frame_length: {}".format(frame_length))
             self.log.info("collected_frames_len: {}".format(
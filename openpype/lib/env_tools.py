@@ -50,12 +50,18 @@ def get_paths_from_environ(env_key=None, env_value=None, return_first=False):
         env_value = os.environ.get(env_key) or ""
 
     path_items = env_value.split(os.pathsep)
+    # Skip stat calls for duplicated paths (common in PATH-like values)
+    seen_paths = set()
     for path in path_items:
         # Skip empty string
         if not path:
             continue
         # Normalize path
         path = os.path.normpath(path)
+        # Skip already processed path
+        if path in seen_paths:
+            continue
+        seen_paths.add(path)
         # Check if path exists
         if os.path.exists(path):
             # Return path if `return_first` is set to True
@@ -7,6 +7,10 @@ import clique
 
 log = logging.getLogger(__name__)
 
+# Version tag like "_v001" or ".v001" with captured digits, compiled
+#   once for the versioning helpers below
+VERSION_REGEX = re.compile(r"[._]v(\d+)", re.IGNORECASE)
+
 
 def format_file_size(file_size, suffix=None):
     """Returns formatted string with size in appropriate unit.
@@ -123,22 +127,58 @@ def version_up(filepath):
     dirname = os.path.dirname(filepath)
     basename, ext = os.path.splitext(os.path.basename(filepath))
 
-    regex = r"[._]v\d+"
-    matches = re.findall(regex, str(basename), re.IGNORECASE)
+    matches = list(VERSION_REGEX.finditer(str(basename)))
     if not matches:
         log.info("Creating version...")
-        new_label = "_v{version:03d}".format(version=1)
-        new_basename = "{}{}".format(basename, new_label)
+        label = None
+        label_head = "_v"
+        padding = 3
+        version_int = 1
     else:
-        label = matches[-1]
-        version = re.search(r"\d+", label).group()
+        label = matches[-1].group(0)
+        version = matches[-1].group(1)
         padding = len(version)
+        # Separator and "v" character of the label
+        label_head = label[:-padding]
+        version_int = int(version) + 1
+
+    # List the directory once; candidate versions are checked against
+    #   the cached names instead of re-listing per existing version
+    with os.scandir(dirname) as entries:
+        existing_names = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(ext)
+        ]
 
-        new_version = int(version) + 1
-        new_version = '{version:0{padding}d}'.format(version=new_version,
+    while True:
+        new_version = '{version:0{padding}d}'.format(version=version_int,
                                                      padding=padding)
-        new_label = label.replace(version, new_version, 1)
-        new_basename = _rreplace(basename, label, new_label)
+        new_label = "{}{}".format(label_head, new_version)
+        if label is None:
+            new_basename = "{}{}".format(basename, new_label)
+        else:
+            new_basename = _rreplace(basename, label, new_label)
+
+        # We check for version clashes against the current file for any file
+        # that matches completely in name up to the {version} label found.
+        # Thus if source file was test_v001_test.txt we want to also check
+        # clashes against test_v002.txt but do want to preserve the part
+        # after the version label for our new filename
+        clash_basename = new_basename
+        if not clash_basename.endswith(new_label):
+            index = (clash_basename.find(new_label))
+            index += len(new_label)
+            clash_basename = clash_basename[:index]
+
+        if not any(
+            name.startswith(clash_basename) for name in existing_names
+        ):
+            break
+
+        log.info("Skipping existing version %s" % new_label)
+        version_int += 1
+
     new_filename = "{}{}".format(new_basename, ext)
     new_filename = os.path.join(dirname, new_filename)
     new_filename = os.path.normpath(new_filename)
@@ -147,22 +187,6 @@ def version_up(filepath):
         raise RuntimeError("Created path is the same as current file,"
                            "this is a bug")
 
-    # We check for version clashes against the current file for any file
-    # that matches completely in name up to the {version} label found. Thus
-    # if source file was test_v001_test.txt we want to also check clashes
-    # against test_v002.txt but do want to preserve the part after the version
-    # label for our new filename
-    clash_basename = new_basename
-    if not clash_basename.endswith(new_label):
-        index = (clash_basename.find(new_label))
-        index += len(new_label)
-        clash_basename = clash_basename[:index]
-
-    for file in os.listdir(dirname):
-        if file.endswith(ext) and file.startswith(clash_basename):
-            log.info("Skipping existing version %s" % new_label)
-            return version_up(new_filename)
-
     log.info("New version %s" % new_label)
     return new_filename
 
@@ -177,9 +201,8 @@ def get_version_from_path(file):
         str: version number in string ('001')
     """
 
-    pattern = re.compile(r"[\._]v([0-9]+)", re.IGNORECASE)
     try:
-        return pattern.findall(file)[-1]
+        return VERSION_REGEX.findall(file)[-1]
     except IndexError:
         log.error(
             "templates:get_version_from_workfile:"
@@ -207,18 +230,19 @@ def get_last_version_from_path(path_dir, filter):
     assert isinstance(filter, list) and (
         len(filter) != 0), "`filter` argument needs to be list and not empty"
 
-    filtred_files = list()
-
-    # form regex for filtering
-    pattern = r".*".join(filter)
+    # Form regex for filtering, escaped so filter items are matched
+    #   as literal strings
+    pattern = re.compile(
+        r".*".join(re.escape(item) for item in filter)
+    )
 
-    for file in os.listdir(path_dir):
-        if not re.findall(pattern, file):
-            continue
-        filtred_files.append(file)
+    filtred_files = [
+        file
+        for file in os.listdir(path_dir)
+        if pattern.search(file)
+    ]
 
     if filtred_files:
-        sorted(filtred_files)
-        return filtred_files[-1]
+        return max(filtred_files)
 
     return None
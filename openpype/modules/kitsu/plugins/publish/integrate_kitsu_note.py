@@ -49,6 +49,32 @@ class IntegrateKitsuNote(pyblish.api.ContextPlugin):
         return re.sub(pattern, replace_missing_key, template)
 
     def process(self, context):
+        # Parse the configured conditions and collect the published
+        # families once, they do not change per instance.
+        status_conditions = [
+            (
+                status_cond["condition"] == "equal",
+                status_cond["short_name"].upper()
+            )
+            for status_cond in self.status_change_conditions[
+                "status_conditions"
+            ]
+        ]
+        family_requirements = [
+            (
+                requirement["condition"] == "equal",
+                requirement["family"].lower()
+            )
+            for requirement in self.status_change_conditions[
+                "family_requirements"
+            ]
+        ]
+        published_families = {
+            instance.data.get("family")
+            for instance in context
+            if instance.data.get("publish")
+        }
+
         for instance in context:
             # Check if instance is a review by checking its family
             # Allow a match to primary family or any of families
@@ -69,31 +95,17 @@ class IntegrateKitsuNote(pyblish.api.ContextPlugin):
 
             # Check if any status condition is not met
             allow_status_change = True
-            for status_cond in self.status_change_conditions[
-                "status_conditions"
-            ]:
-                condition = status_cond["condition"] == "equal"
-                match = status_cond["short_name"].upper() == shortname
+            for condition, condition_shortname in status_conditions:
+                match = condition_shortname == shortname
                 if match and not condition or condition and not match:
                     allow_status_change = False
                     break
 
             if allow_status_change:
-                # Get families
-                families = {
-                    instance.data.get("family")
-                    for instance in context
-                    if instance.data.get("publish")
-                }
-
                 # Check if any family requirement is met
-                for family_requirement in self.status_change_conditions[
-                    "family_requirements"
-                ]:
-                    condition = family_requirement["condition"] == "equal"
-
-                    for family in families:
-                        match = family_requirement["family"].lower() == family
+                for condition, requirement_family in family_requirements:
+                    for family in published_families:
+                        match = requirement_family == family
                         if match and not condition or condition and not match:
                             allow_status_change = False
                             break
@@ -1,5 +1,7 @@
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from openpype.client.entities import get_representations
 from openpype.lib.applications import PreLaunchHook, LaunchTypes
@@ -14,6 +16,13 @@ from openpype.pipeline.workfile.path_resolving import (
 from openpype.settings.lib import get_project_settings
 
 
+@lru_cache(maxsize=32)
+def _get_project_settings(project_name):
+    """Cached project settings to avoid a db query on each launch."""
+
+    return get_project_settings(project_name)
+
+
 class CopyLastPublishedWorkfile(PreLaunchHook):
     """Copy last published workfile as first workfile.
 
@@ -65,7 +74,7 @@ class CopyLastPublishedWorkfile(PreLaunchHook):
         host_name = self.application.host_name
 
         # Check settings has enabled it
-        project_settings = get_project_settings(project_name)
+        project_settings = _get_project_settings(project_name)
         profiles = project_settings["global"]["tools"]["Workfiles"][
             "last_workfile_on_startup"
         ]
@@ -116,12 +125,21 @@ class CopyLastPublishedWorkfile(PreLaunchHook):
             "task": {"name": task_name, "type": task_type}
         }
 
-        workfile_representations = list(get_representations(
+        # Pick the highest version reading each representation's version
+        #   only once, without lambda key calls
+        workfile_representation = None
+        highest_version = -1
+        for repre in get_representations(
             project_name,
-            context_filters=context_filters
-        ))
-
-        if not workfile_representations:
+            context_filters=context_filters,
+            fields=["_id", "context", "data.template"]
+        ):
+            version = repre["context"].get("version")
+            if version is not None and version > highest_version:
+                workfile_representation = repre
+                highest_version = version
+
+        if workfile_representation is None:
             self.log.debug(
                 'No published workfile for task "{}" and host "{}".'.format(
                     task_name, host_name
@@ -129,51 +147,55 @@ class CopyLastPublishedWorkfile(PreLaunchHook):
             )
             return
 
-        filtered_repres = filter(
-            lambda r: r["context"].get("version") is not None,
-            workfile_representations
-        )
-        workfile_representation = max(
-            filtered_repres, key=lambda r: r["context"]["version"]
-        )
-
         # Copy file and substitute path
-        last_published_workfile_path = download_last_published_workfile(
-            host_name,
-            project_name,
-            task_name,
-            workfile_representation,
-            max_retries,
-            anatomy=anatomy
-        )
+        # Download is network bound and independent of the template
+        #   resolution below, so run it in a thread and overlap both.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            download_future = executor.submit(
+                download_last_published_workfile,
+                host_name,
+                project_name,
+                task_name,
+                workfile_representation,
+                max_retries,
+                anatomy=anatomy
+            )
+
+            project_doc = self.data["project_doc"]
+
+            project_settings = self.data["project_settings"]
+            template_key = get_workfile_template_key(
+                task_name, host_name, project_name, project_settings
+            )
+
+            # Get workfile data
+            workfile_data = get_template_data(
+                project_doc, asset_doc, task_name, host_name
+            )
+
+            last_published_workfile_path = download_future.result()
+
         if not last_published_workfile_path:
             self.log.debug(
                 "Couldn't download {}".format(last_published_workfile_path)
             )
             return
 
-        project_doc = self.data["project_doc"]
-
-        project_settings = self.data["project_settings"]
-        template_key = get_workfile_template_key(
-            task_name, host_name, project_name, project_settings
-        )
-
-        # Get workfile data
-        workfile_data = get_template_data(
-            project_doc, asset_doc, task_name, host_name
-        )
-
-        extension = last_published_workfile_path.split(".")[-1]
+        extension = os.path.splitext(last_published_workfile_path)[1][1:]
         workfile_data["version"] = (
                 workfile_representation["context"]["version"] + 1)
         workfile_data["ext"] = extension
 
-        anatomy_result = anatomy.format(workfile_data)
-        local_workfile_path = anatomy_result[template_key]["path"]
+        # Format only the workfile template instead of every template
+        #   in the anatomy
+        template_obj = anatomy.templates_obj[template_key]["path"]
+        local_workfile_path = template_obj.format_strict(workfile_data)
 
         # Copy last published workfile to local workfile directory
-        shutil.copy(
+        # 'copyfile' uses zero-copy syscalls (sendfile/CopyFile2) where
+        #   the platform supports them and skips the permission-bits
+        #   copy done by 'shutil.copy'.
+        shutil.copyfile(
             last_published_workfile_path,
             local_workfile_path,
         )
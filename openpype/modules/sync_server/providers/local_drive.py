@@ -186,7 +186,10 @@ class LocalDriveHandler(AbstractProvider):
     def _copy(self, source_path, target_path):
         print("copying {}->{}".format(source_path, target_path))
         try:
-            shutil.copy(source_path, target_path)
+            # 'copyfile' keeps the transfer inside the kernel
+            #   (sendfile/CopyFile2) where supported, which matters when
+            #   many representation files are copied in flight
+            shutil.copyfile(source_path, target_path)
         except shutil.SameFileError:
             print("same files, skipping")
 
@@ -6,6 +6,7 @@ import concurrent.futures
 from time import sleep
 
 from .providers import lib
+from openpype.client import get_representations
 from openpype.client.entity_links import get_linked_representation_id
 from openpype.lib import Logger
 from openpype.lib.local_settings import get_local_site_id
@@ -194,6 +195,35 @@ def _site_is_working(module, project_name, site_name, site_config):
     return handler.is_active()
 
 
+def _is_representation_doc_on_site(representation, site_name):
+    """Check a queried representation document for site availability.
+
+    Same check as 'SyncServerModule.is_representation_on_site' but works
+    on an already fetched document so presence of many representations
+    can be resolved with a single query.
+
+    Args:
+        representation (dict): Representation document with 'files'.
+        site_name (str): Name of site to check.
+
+    Returns:
+        bool: All representation files are available on the site.
+    """
+
+    on_site = False
+    for file_info in representation.get("files", []):
+        for site in file_info.get("sites", []):
+            if site["name"] != site_name:
+                continue
+
+            if (site.get("progress") or site.get("error") or
+                    not site.get("created_dt")):
+                return False
+            on_site = True
+
+    return on_site
+
+
 def download_last_published_workfile(
     host_name: str,
     project_name: str,
@@ -263,12 +293,18 @@ def download_last_published_workfile(
             project_name, repre_id=workfile_representation["_id"]
         )
     )
-    for repre_id in representation_ids:
-        if not sync_server.is_representation_on_site(project_name, repre_id,
-                                                     local_site_id):
+    # Fetch sync state of all linked representations with one query
+    #   instead of one presence check round-trip per representation
+    repre_docs = get_representations(
+        project_name,
+        representation_ids=representation_ids,
+        fields=["_id", "files"]
+    )
+    for repre_doc in repre_docs:
+        if not _is_representation_doc_on_site(repre_doc, local_site_id):
             sync_server.add_site(
                 project_name,
-                repre_id,
+                repre_doc["_id"],
                 local_site_id,
                 force=True,
                 priority=99
@@ -276,11 +312,15 @@ def download_last_published_workfile(
     sync_server.reset_timer()
     print("Starting to download:{}".format(last_published_workfile_path))
     # While representation unavailable locally, wait.
+    # Poll with exponential backoff so a file which is synchronized
+    # quickly doesn't block the launch for a whole fixed interval.
+    poll_delay = 0.1
     while not sync_server.is_representation_on_site(
         project_name, workfile_representation["_id"], local_site_id,
         max_retries=max_retries
     ):
-        sleep(5)
+        sleep(poll_delay)
+        poll_delay = min(poll_delay * 2, 2.0)
 
     return last_published_workfile_path
 